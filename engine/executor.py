@@ -1,15 +1,18 @@
 # engine/executor.py
+import re
 import json
 import logging
+import operator
 import time
 import traceback
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 
 from jsonschema import validate, ValidationError
 import jmespath
 
-from engine.template import render_templates, TemplateRenderError
+from engine.template import render_templates, TemplateRenderError, compile_path, lookup_path
 # TODO: Tool calling removed - will be implemented as extensions
 # from engine.registry import load_catalog, get_tool
 # from engine.mcp_client import call_tool
@@ -40,6 +43,34 @@ class ConditionEvaluationError(PipelineExecutionError):
     """Exception raised when step condition evaluation fails."""
     pass
 
+# Parsed JMESPath ASTs keyed by the raw `if` expression; pipelines re-run the
+# same conditions on every execution, so each one is parsed once per process
+_compile_condition = lru_cache(maxsize=512)(jmespath.compile)
+
+# `<path> <op> <JSON number literal>` conditions, e.g. steps.weather.temp < `10`;
+# `01`-style literals are strings to JMESPath, so they never match here
+_SIMPLE_CONDITION = re.compile(r"\s*(\S+?)\s*(<=|>=|==|!=|<|>)\s*`(-?(?:0|[1-9]\d*)(?:\.\d+)?)`\s*")
+_COMPARATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne
+}
+
+@lru_cache(maxsize=512)
+def _parse_simple_condition(expr: str):
+    """
+    Split a plain numeric comparison into (path, comparator, literal).
+    
+    Returns None for any other expression shape, which is left to JMESPath.
+    """
+    match = _SIMPLE_CONDITION.fullmatch(expr)
+    if not match:
+        return None
+    path = compile_path(match.group(1))
+    if path is None:
+        return None
+    literal = match.group(3)
+    return path, _COMPARATORS[match.group(2)], float(literal) if "." in literal else int(literal)
+
 def _eval_condition(expr: str, ctx: dict) -> bool:
     """
     Evaluate JMESPath boolean expression for step conditions.
@@ -55,7 +86,16 @@ def _eval_condition(expr: str, ctx: dict) -> bool:
         ConditionEvaluationError: If expression evaluation fails
     """
     try:
-        result = jmespath.search(expr, ctx)
+        # Numeric comparisons against a literal skip the JMESPath interpreter;
+        # any other operand type takes the full path so its semantics hold
+        simple = _parse_simple_condition(expr)
+        if simple is not None:
+            path, compare, literal = simple
+            value = lookup_path(path, ctx)
+            if type(value) in (int, float):
+                return compare(value, literal)
+        
+        result = _compile_condition(expr).search(ctx)
         if result is None:
             logger.warning(f"Condition expression '{expr}' returned None, treating as False")
             return False
@@ -116,10 +156,19 @@ def _validate_pipeline_structure(pipeline: Any) -> None:
         logger.warning("Pipeline is empty - no steps to execute")
         return
     
-    # Check for duplicate step IDs
-    step_ids = [step.get("id") for step in pipeline if step.get("id")]
-    if len(step_ids) != len(set(step_ids)):
-        duplicates = [sid for sid in set(step_ids) if step_ids.count(sid) > 1]
+    # Check for duplicate step IDs in one pass (id -> first-seen index)
+    first_seen = {}
+    duplicates = []
+    for step_index, step in enumerate(pipeline):
+        step_id = step.get("id")
+        if not step_id:
+            continue
+        if step_id not in first_seen:
+            first_seen[step_id] = step_index
+        elif step_id not in duplicates:
+            duplicates.append(step_id)
+    
+    if duplicates:
         raise PipelineExecutionError(
             f"Duplicate step IDs found: {duplicates}"
         )
@@ -169,7 +218,7 @@ def _execute_step(step: dict, step_index: int, catalog: List[Dict], ctx: dict) -
     """
     step_id = step.get("id", f"step_{step_index}")
     step_unique_id = generate_step_id(step_id)
-    step_start_time = time.time()
+    step_start_time = time.perf_counter()
     
     # Set logging context for step execution
     set_request_context(step_id=step_unique_id)
@@ -215,7 +264,7 @@ def _execute_step(step: dict, step_index: int, catalog: List[Dict], ctx: dict) -
         
         # SIMULATE tool execution (tools removed from core system)
         timeout = step.get("timeout_seconds", 30)
-        tool_start_time = time.time()
+        tool_start_time = time.perf_counter()
         
         # Log what would be called
         logger.info(f"SIMULATED tool call: {addr} with args: {rendered_args}")
@@ -230,7 +279,7 @@ def _execute_step(step: dict, step_index: int, catalog: List[Dict], ctx: dict) -
         }
         
         # Record simulated tool call metrics
-        tool_duration = time.time() - tool_start_time
+        tool_duration = time.perf_counter() - tool_start_time
         orchestrator_metrics.record_external_tool_call(
             tool_address=addr,
             method='simulated',
@@ -259,7 +308,7 @@ def _execute_step(step: dict, step_index: int, catalog: List[Dict], ctx: dict) -
             ctx["steps"][save_key] = result
             logger.debug(f"Step '{step_id}' result saved as '{save_key}'")
         
-        execution_time = time.time() - step_start_time
+        execution_time = time.perf_counter() - step_start_time
         success = True
         
         # Record step metrics
@@ -299,7 +348,7 @@ def _execute_step(step: dict, step_index: int, catalog: List[Dict], ctx: dict) -
     finally:
         # Always record step metrics, even on failure
         if not success:
-            execution_time = time.time() - step_start_time
+            execution_time = time.perf_counter() - step_start_time
             orchestrator_metrics.record_step_execution(
                 tool_addr=tool_addr,
                 step_id=step_unique_id,
@@ -370,7 +419,7 @@ def run_pipeline(task: dict) -> dict:
         result = run_pipeline(task)
         print(result["steps"]["forecast"])  # Weather forecast data
     """
-    execution_start = time.time()
+    execution_start = time.perf_counter()
     
     # Extract task metadata
     task_id = task.get('id', 'unknown')
@@ -426,7 +475,7 @@ def run_pipeline(task: dict) -> dict:
                     
             except Exception as e:
                 # Add execution summary to context for debugging
-                execution_time = time.time() - execution_start
+                execution_time = time.perf_counter() - execution_start
                 ctx["_execution_summary"] = {
                     "success": False,
                     "total_steps": len(pipeline),
@@ -456,7 +505,7 @@ def run_pipeline(task: dict) -> dict:
                 raise
         
         # Add successful execution summary
-        execution_time = time.time() - execution_start
+        execution_time = time.perf_counter() - execution_start
         ctx["_execution_summary"] = {
             "success": True,
             "total_steps": len(pipeline),
@@ -2,7 +2,8 @@
 import re
 import json
 import logging
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 import jmespath
 
@@ -18,6 +19,15 @@ class TemplateRenderError(Exception):
 # Pattern for variable substitution: ${variable.path}
 _TEMPLATE_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
+# Plain field/index paths (params.user.name, steps.calendar.events[0].title)
+# that can be resolved by walking the context without the JMESPath parser
+_SIMPLE_PATH_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*")
+_PATH_TOKEN_PATTERN = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]")
+
+# Parsed JMESPath ASTs keyed by expression text; the same placeholders are
+# evaluated on every run of a task, so each is parsed once per process
+_compile_expression = lru_cache(maxsize=4096)(jmespath.compile)
+
 def _safe_jmespath_search(expression: str, data: dict) -> Any:
     """
     Safely evaluate JMESPath expression with detailed error handling.
@@ -33,7 +43,7 @@ def _safe_jmespath_search(expression: str, data: dict) -> Any:
         TemplateRenderError: If expression evaluation fails
     """
     try:
-        result = jmespath.search(expression, data)
+        result = _compile_expression(expression).search(data)
         return result
     except Exception as e:
         raise TemplateRenderError(
@@ -42,6 +52,107 @@ def _safe_jmespath_search(expression: str, data: dict) -> Any:
             cause=e
         )
 
+def compile_path(expression: str) -> Optional[tuple]:
+    """
+    Parse a plain field/index expression into a tuple of lookup keys.
+    
+    Args:
+        expression: JMESPath expression, e.g. "steps.weather.items[0]"
+        
+    Returns:
+        Tuple of str field names and int indices, or None for anything beyond
+        dotted fields and non-negative indices (functions, filters, comparisons,
+        literals), which must go through JMESPath
+    """
+    if not _SIMPLE_PATH_PATTERN.fullmatch(expression):
+        return None
+    return tuple(
+        field if field else int(index)
+        for field, index in _PATH_TOKEN_PATTERN.findall(expression)
+    )
+
+def lookup_path(path: tuple, data: Any) -> Any:
+    """
+    Resolve a path from compile_path() against data with JMESPath semantics.
+    
+    Args:
+        path: Tuple of lookup keys returned by compile_path()
+        data: Context to walk
+        
+    Returns:
+        The value at the path, or None if any key or index is missing
+    """
+    current = data
+    for key in path:
+        if isinstance(key, int):
+            if not isinstance(current, list):
+                return None
+            try:
+                current = current[key]
+            except IndexError:
+                return None
+        else:
+            try:
+                current = current.get(key)
+            except AttributeError:
+                return None
+        if current is None:
+            return None
+    return current
+
+def _format_value(result: Any) -> str:
+    """Convert a resolved variable value to its string substitution."""
+    # Exact type checks first: bool cannot be subclassed, and JMESPath hands
+    # back plain str values for the common case
+    if type(result) is str:
+        return result
+    elif type(result) is bool:
+        return "true" if result else "false"
+    elif isinstance(result, (dict, list)):
+        return json.dumps(result)
+    else:
+        return str(result)
+
+def _resolve_variable(expression: str, context: dict, path: tuple = None) -> str:
+    """
+    Resolve a single ${...} expression against the context.
+    
+    Args:
+        expression: Stripped JMESPath expression (without ${} delimiters)
+        context: Context dictionary for variable resolution
+        path: Precompiled lookup keys for plain paths, or None to use JMESPath
+        
+    Returns:
+        String substitution for the expression
+        
+    Raises:
+        TemplateRenderError: If the expression cannot be evaluated
+    """
+    try:
+        if path is not None:
+            result = lookup_path(path, context)
+        else:
+            result = _safe_jmespath_search(expression, context)
+        
+        if result is None:
+            # Check if this was a valid path that just returned null
+            # vs an invalid path that doesn't exist
+            logger.warning(f"Variable expression '${{{expression}}}' resolved to None")
+            return "null"
+        
+        # Convert result to string, handling different types appropriately
+        return _format_value(result)
+            
+    except TemplateRenderError:
+        # Re-raise template errors as-is
+        raise
+    except Exception as e:
+        raise TemplateRenderError(
+            f"Failed to render variable '${{{expression}}}': {e}",
+            expression=expression,
+            cause=e
+        )
+
 def _render_string_template(template_str: str, context: dict) -> str:
     """
     Render template variables in a string.
@@ -59,44 +170,12 @@ def _render_string_template(template_str: str, context: dict) -> str:
     if not isinstance(template_str, str):
         return template_str
     
-    def replace_variable(match):
-        expression = match.group(1).strip()
-        
-        if not expression:
-            raise TemplateRenderError(
-                "Empty variable expression found: ${}",
-                expression=""
-            )
-        
-        try:
-            result = _safe_jmespath_search(expression, context)
-            
-            if result is None:
-                # Check if this was a valid path that just returned null
-                # vs an invalid path that doesn't exist
-                logger.warning(f"Variable expression '${{{expression}}}' resolved to None")
-                return "null"
-            
-            # Convert result to string, handling different types appropriately
-            if isinstance(result, bool):
-                return "true" if result else "false"
-            elif isinstance(result, (dict, list)):
-                return json.dumps(result)
-            else:
-                return str(result)
-                
-        except TemplateRenderError:
-            # Re-raise template errors as-is
-            raise
-        except Exception as e:
-            raise TemplateRenderError(
-                f"Failed to render variable '${{{expression}}}': {e}",
-                expression=expression,
-                cause=e
-            )
+    # Static strings (most `with:` values) skip compilation and the cache lookup
+    if "${" not in template_str:
+        return template_str
     
     try:
-        return _TEMPLATE_PATTERN.sub(replace_variable, template_str)
+        return _get_compiled_template(template_str).render(context)
     except Exception as e:
         if isinstance(e, TemplateRenderError):
             raise
@@ -105,6 +184,110 @@ def _render_string_template(template_str: str, context: dict) -> str:
             cause=e
         )
 
+class CompiledTemplate:
+    """
+    Template string pre-split into literal text and ${...} expressions.
+    
+    Parsing happens once at construction; render() only resolves the
+    expressions and joins the pieces, so a template rendered many times
+    with different contexts skips the per-call regex scan. Plain
+    field/index paths are also pre-split into lookup keys so they resolve
+    by walking the context instead of through the JMESPath parser.
+    
+    Examples:
+        >>> compiled = compile_template("Hello ${params.name}")
+        >>> compiled.render({"params": {"name": "John"}})
+        "Hello John"
+    """
+    __slots__ = ("source", "parts", "expressions")
+    
+    def __init__(self, source: str):
+        self.source = source
+        # Output layout with literal text filled in and None in each
+        # expression slot; render() copies it and fills the slots
+        self.parts = []
+        self.expressions = []  # (slot_indices, expression, path or None)
+        
+        # Identical placeholders (${steps.a.x} ... ${steps.a.x}) share one
+        # entry, so each distinct path is resolved once per render
+        entries = {}
+        position = 0
+        for match in _TEMPLATE_PATTERN.finditer(source):
+            expression = match.group(1).strip()
+            if not expression:
+                raise TemplateRenderError(
+                    "Empty variable expression found: ${}",
+                    expression=""
+                )
+            self.parts.append(source[position:match.start()])
+            path = compile_path(expression)
+            key = path if path is not None else expression
+            if key not in entries:
+                entries[key] = ([], expression, path)
+            entries[key][0].append(len(self.parts))
+            self.parts.append(None)
+            position = match.end()
+        
+        self.parts.append(source[position:])
+        self.expressions = [
+            (tuple(slots), expression, path) for slots, expression, path in entries.values()
+        ]
+    
+    def render(self, context: dict) -> str:
+        """Render the compiled template against a context dictionary."""
+        if len(self.parts) == 3:
+            # Single placeholder (the common "${params.x}" case): concatenate
+            # directly instead of copying and joining the parts list
+            _, expression, path = self.expressions[0]
+            prefix, _, suffix = self.parts
+            return prefix + _resolve_variable(expression, context, path) + suffix
+        
+        parts = self.parts.copy()
+        for slots, expression, path in self.expressions:
+            value = _resolve_variable(expression, context, path)
+            for index in slots:
+                parts[index] = value
+        return "".join(parts)
+
+def compile_template(template_str: str) -> CompiledTemplate:
+    """
+    Compile a template string for repeated rendering.
+    
+    Args:
+        template_str: String containing ${variable} expressions
+        
+    Returns:
+        CompiledTemplate whose render() produces the same output as
+        render_templates() for that string
+        
+    Raises:
+        TemplateRenderError: If the template contains an empty expression
+    """
+    return CompiledTemplate(template_str)
+
+@lru_cache(maxsize=1024)
+def _get_compiled_template(template_str: str) -> CompiledTemplate:
+    """Compiled template for a string, cached across render_templates() calls."""
+    return CompiledTemplate(template_str)
+
+def _render_object(obj: Any, ctx: dict) -> Any:
+    """Recursive worker for render_templates(); ctx has already been validated."""
+    if isinstance(obj, str):
+        # Static strings are returned without entering the template machinery
+        if "${" not in obj:
+            return obj
+        return _render_string_template(obj, ctx)
+    
+    elif isinstance(obj, dict):
+        return {key: _render_object(value, ctx) for key, value in obj.items()}
+    
+    elif isinstance(obj, list):
+        return [_render_object(item, ctx) for item in obj]
+    
+    else:
+        # Return non-template types as-is (numbers, booleans, None, etc.)
+        return obj
+
 def render_templates(obj: Any, ctx: dict) -> Any:
     """
     Recursively render template variables in nested data structures.
@@ -156,18 +339,7 @@ def render_templates(obj: Any, ctx: dict) -> Any:
         raise TemplateRenderError(f"Context must be a dictionary, got {type(ctx).__name__}")
     
     try:
-        if isinstance(obj, dict):
-            return {key: render_templates(value, ctx) for key, value in obj.items()}
-        
-        elif isinstance(obj, list):
-            return [render_templates(item, ctx) for item in obj]
-        
-        elif isinstance(obj, str):
-            return _render_string_template(obj, ctx)
-        
-        else:
-            # Return non-template types as-is (numbers, booleans, None, etc.)
-            return obj
+        return _render_object(obj, ctx)
             
     except TemplateRenderError:
         # Re-raise template errors as-is
@@ -16,7 +16,9 @@ import time
 
 from .base import Capability, Extension, ExtensionInfo
 from .schema import MANIFEST_SCHEMA
-from jsonschema import validate
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from ordinaut.engine.registry import (
     ToolRegistry,
     ToolRegistryView,
@@ -26,6 +28,20 @@ from .background import BackgroundTaskSupervisor
 from .events import EventsManager
 from importlib import metadata as importlib_metadata
 
+# Built once: jsonschema.validate() re-checks the schema and rebuilds a
+# validator for every manifest it is handed. The validator class follows the
+# schema's $schema dialect, as jsonschema.validate() would pick it
+_MANIFEST_VALIDATOR_CLASS = validator_for(MANIFEST_SCHEMA, default=Draft202012Validator)
+_MANIFEST_VALIDATOR_CLASS.check_schema(MANIFEST_SCHEMA)
+_MANIFEST_VALIDATOR = _MANIFEST_VALIDATOR_CLASS(MANIFEST_SCHEMA)
+
+
+def _validate_manifest(manifest: dict[str, Any]) -> None:
+    """Raise the most relevant ValidationError for an invalid manifest, like jsonschema.validate()."""
+    error = best_match(_MANIFEST_VALIDATOR.iter_errors(manifest))
+    if error is not None:
+        raise error
+
 
 @dataclass
 class ExtensionSpec:
@@ -60,7 +76,7 @@ class ExtensionLoader:
                 if manifest.exists() and module.exists():
                     with manifest.open() as f:
                         m = json.load(f)
-                    validate(instance=m, schema=MANIFEST_SCHEMA)
+                    _validate_manifest(m)
                     grants = set(Capability[g] for g in m.get("grants", []))
                     specs.append(ExtensionSpec(
                         id=m["id"], root=d, module=str(module),
@@ -77,7 +93,7 @@ class ExtensionLoader:
                 if manifest.exists() and module.exists():
                     with manifest.open() as f:
                         m = json.load(f)
-                    validate(instance=m, schema=MANIFEST_SCHEMA)
+                    _validate_manifest(m)
                     grants = set(Capability[g] for g in m.get("grants", []))
                     specs.append(ExtensionSpec(
                         id=m["id"], root=path, module=str(module),
@@ -50,6 +50,17 @@ class SimpleTestEnvironment:
     async def apply_test_schema(self):
         """Apply minimal database schema for testing."""
         
+        if self.db_engine.dialect.name == "postgresql":
+            # PostgreSQL databases get the real schema from migrations/;
+            # only seed the system agent
+            with self.db_engine.begin() as conn:
+                conn.execute(text("""
+                    INSERT INTO agent (id, name, scopes) VALUES
+                    ('00000000-0000-0000-0000-000000000001', 'test-system', ARRAY['admin', 'test'])
+                    ON CONFLICT (id) DO NOTHING
+                """))
+            return
+        
         # Execute each statement separately for SQLite compatibility
         statements = [
             """CREATE TABLE IF NOT EXISTS agent (
@@ -95,7 +106,9 @@ class SimpleTestEnvironment:
                 created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (task_id) REFERENCES task(id)
             )""",
-            """CREATE INDEX IF NOT EXISTS idx_due_work_run_at ON due_work (run_at)""",
+            # Covering index for the lease query: run_at range + locked_until
+            # filter served without touching the table rows
+            """CREATE INDEX IF NOT EXISTS idx_due_work_leasable ON due_work (run_at, locked_until, id, task_id)""",
             """INSERT OR REPLACE INTO agent (id, name, scopes) VALUES 
                ('00000000-0000-0000-0000-000000000001', 'test-system', '["admin", "test"]')"""
         ]
@@ -110,8 +123,9 @@ class SimpleTestEnvironment:
             self.db_engine.dispose()
         
         # Remove test database file
-        if os.path.exists("test_simple.db"):
-            os.remove("test_simple.db")
+        database = self.db_engine.url.database if self.db_engine else None
+        if self.db_url.startswith("sqlite") and database and os.path.exists(database):
+            os.remove(database)
     
     async def clean_database(self):
         """Clean database state for each test."""
@@ -284,7 +298,9 @@ async def insert_test_agent(db_engine, agent_data=None):
             RETURNING *
         """), {
             **agent_data,
-            "scopes": json.dumps(agent_data["scopes"])
+            # text[] on PostgreSQL, JSON text in the SQLite test schema
+            "scopes": (agent_data["scopes"] if db_engine.dialect.name == "postgresql"
+                       else json.dumps(agent_data["scopes"]))
         })
         return dict(result.fetchone()._mapping)
 
@@ -334,5 +350,56 @@ async def insert_due_work(db_engine, task_id, run_at=None):
         return result.scalar()
 
 
+
+_TASK_COLUMNS = ("id", "title", "description", "created_by", "schedule_kind", "schedule_expr",
+                 "timezone", "payload", "status", "priority", "max_retries")
+
+
+def _copy_rows(db_engine, table, columns, rows):
+    """Load rows with COPY FROM STDIN if the engine runs on psycopg 3.
+    
+    Returns False (without touching the database) for any other driver,
+    so callers fall back to executemany.
+    """
+    if db_engine.dialect.name != "postgresql" or db_engine.dialect.driver != "psycopg":
+        return False
+    
+    with db_engine.begin() as conn:
+        with conn.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+    return True
+
+
+async def bulk_insert_due_work(db_engine, task_ids, run_at=None):
+    """Insert one due work item per task id in a single COPY or executemany."""
+    if run_at is None:
+        run_at = datetime.now(timezone.utc)
+    
+    rows = [{"task_id": task_id, "run_at": run_at} for task_id in task_ids]
+    if _copy_rows(db_engine, "due_work", ("task_id", "run_at"), rows):
+        return
+    
+    with db_engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO due_work (task_id, run_at)
+            VALUES (:task_id, :run_at)
+        """), rows)
+
+
+async def bulk_insert_tasks(db_engine, task_rows):
+    """Insert prepared task rows (payload as JSON text) in a single COPY or executemany."""
+    if _copy_rows(db_engine, "task", _TASK_COLUMNS, task_rows):
+        return
+    
+    with db_engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO task (id, title, description, created_by, schedule_kind, schedule_expr,
+                              timezone, payload, status, priority, max_retries)
+            VALUES (:id, :title, :description, :created_by, :schedule_kind, :schedule_expr,
+                    :timezone, :payload, :status, :priority, :max_retries)
+        """), task_rows)
+
 # Configure pytest-asyncio
 pytest_asyncio.fixture(scope="session")
\ No newline at end of file
@@ -15,6 +15,7 @@ import sys
 import pytest
 import json
 import uuid
+import jmespath
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
@@ -245,6 +246,27 @@ class TestConditionEvaluation:
         # Missing value should be treated as False
         result = _eval_condition("params.missing_key", context)
         assert result == False
+    
+    def test_numeric_comparison_fast_path_matches_jmespath(self):
+        """Test that plain numeric comparisons agree with full JMESPath evaluation."""
+        context = {
+            "params": {"count": 5, "ratio": 0.5, "flag": True, "name": "five", "one": 1},
+            "steps": {"weather": {"temp": 8}}
+        }
+        expressions = [
+            "steps.weather.temp < `10`", "steps.weather.temp >= `8`",
+            "params.count == `5`", "params.count != `5`", "params.ratio <= `0.5`",
+            "params.count > `-1`", "params.flag == `1`", "params.name == `5`",
+            "params.missing < `10`", "params.one != `01`", "params.one == `01`"
+        ]
+        
+        for expression in expressions:
+            expected = jmespath.search(expression, context)
+            assert _eval_condition(expression, context) == bool(expected), expression
+        
+        # Leading zeros are not JSON numbers: JMESPath reads `01` as a string
+        with pytest.raises(ConditionEvaluationError):
+            _eval_condition("params.one < `01`", context)
 
 
 class TestPipelineExecution:
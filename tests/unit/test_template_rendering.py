@@ -11,14 +11,17 @@ Tests all template rendering functionality including:
 """
 
 import pytest
+import gc
 import time
 import json
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+import jmespath
+
 from engine.template import (
     render_templates, extract_template_variables, validate_template_variables,
-    TemplateRenderError
+    compile_template, TemplateRenderError, _format_value
 )
 
 
@@ -534,6 +537,10 @@ class TestPerformanceOptimization:
         for i in range(100):
             context["steps"][f"data_{i}"] = {"value": f"value_{i}", "active": True}
         
+        # Settle garbage left by earlier tests so a full collection of the
+        # session's objects does not land inside the timed window
+        gc.collect()
+        
         start_time = time.perf_counter()
         result = render_templates(large_template, context)
         end_time = time.perf_counter()
@@ -560,6 +567,57 @@ class TestPerformanceOptimization:
             }
             result = render_templates(template, context)
             assert f"User{i}" in result
+    
+    def test_compiled_template_matches_render_templates(self):
+        """Test that a compiled template renders identically across contexts."""
+        template = "Hello ${params.name}, flags: ${params.flags}, ok: ${params.ok}!"
+        compiled = compile_template(template)
+        
+        for i in range(10):
+            context = {"params": {"name": f"User{i}", "flags": [i, i + 1], "ok": i % 2 == 0}}
+            assert compiled.render(context) == render_templates(template, context)
+        
+        assert compile_template("no variables").render({}) == "no variables"
+        
+        with pytest.raises(TemplateRenderError):
+            compile_template("Value: ${ }")
+
+    def test_plain_path_lookup_matches_jmespath(self):
+        """Test that plain paths resolved without JMESPath give JMESPath's results."""
+        context = {
+            "params": {"name": "Alice", "count": 0, "enabled": False, "tags": ["a", "b"]},
+            "steps": {"calendar": {"events": [{"title": "Meeting"}]}, "weather": None}
+        }
+        expressions = [
+            "params.name", "params.count", "params.enabled", "params.tags",
+            "params.tags[1]", "params.tags[5]", "params.name[0]", "params.missing",
+            "steps.calendar.events[0].title", "steps.weather.temp", "missing.path"
+        ]
+
+        for expression in expressions:
+            expected = jmespath.search(expression, context)
+            expected = "null" if expected is None else _format_value(expected)
+            assert render_templates(f"${{{expression}}}", context) == expected, expression
+
+    def test_shared_path_prefixes_render_independently(self):
+        """Test that placeholders sharing a path prefix each resolve their own value."""
+        template = (
+            "Wind ${steps.weather.details.wind.speed} ${steps.weather.details.wind.direction}, "
+            "gusts ${steps.weather.details.gusts.max}, first ${params.items[0]} last ${params.items[1]}"
+        )
+        context = {
+            "steps": {"weather": {"details": {"wind": {"speed": 12, "direction": "NW"}}}},
+            "params": {"items": ["a", "b"]}
+        }
+
+        assert render_templates(template, context) == "Wind 12 NW, gusts null, first a last b"
+
+    def test_repeated_placeholders_fill_every_slot(self):
+        """Test that a placeholder used several times is substituted at each occurrence."""
+        template = "${steps.a.x}-${params.n}-${steps.a.x}-${length(params.items)}-${length(params.items)}"
+        context = {"steps": {"a": {"x": "v"}}, "params": {"n": 1, "items": [1, 2]}}
+
+        assert render_templates(template, context) == "v-1-v-2-2"
 
 
 class TestEdgeCases:
@@ -23,6 +23,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from workers.runner import WorkerRunner
 from workers.config import WorkerConfig, WorkerMetrics, WorkerState
 from workers.coordinator import WorkerCoordinator
+from engine.executor import PipelineExecutionError
 
 
 class TestSkipLockedLeasing:
@@ -229,6 +230,66 @@ class TestRetryMechanisms:
         delay_high = worker.exponential_backoff_with_jitter(10)
         assert delay_high <= 60.0  # Should be capped at max_delay
     
+    def test_adaptive_poll_interval(self):
+        """Test idle poll interval doubles on misses and resets on a lease."""
+        config = WorkerConfig.from_dict({
+            "worker_id": "test-worker",
+            "database_url": "sqlite:///:memory:",
+            "initial_poll_interval": 0.1,
+            "min_poll_interval": 0.05,
+            "max_poll_interval": 0.5
+        })
+        worker = WorkerRunner(config)
+        
+        assert worker.poll_interval == 0.1
+        assert worker.next_poll_interval(found_work=False) == 0.2
+        assert worker.next_poll_interval(found_work=False) == 0.4
+        assert worker.next_poll_interval(found_work=False) == 0.5  # Capped at max
+        assert worker.next_poll_interval(found_work=True) == 0.05  # Reset to min
+
+    def test_poll_interval_validation(self):
+        """Test poll intervals are coerced to float and checked for min <= initial <= max."""
+        base_config = {
+            "worker_id": "test-worker",
+            "database_url": "sqlite:///:memory:"
+        }
+
+        config = WorkerConfig.from_dict({
+            **base_config,
+            "initial_poll_interval": "1",
+            "min_poll_interval": "0.5",
+            "max_poll_interval": 2
+        })
+        assert config.initial_poll_interval == 1.0
+        assert isinstance(config.min_poll_interval, float)
+        assert isinstance(config.max_poll_interval, float)
+
+        invalid_intervals = [
+            {"min_poll_interval": 0, "initial_poll_interval": 0},  # Busy-loop
+            {"min_poll_interval": -0.1},  # Negative
+            {"min_poll_interval": 2.0, "max_poll_interval": 1.0},  # Min above max
+            {"initial_poll_interval": 5.0, "max_poll_interval": 1.0},  # Initial above max
+            {"initial_poll_interval": 0.01, "min_poll_interval": 0.05}  # Initial below min
+        ]
+        for intervals in invalid_intervals:
+            with pytest.raises(ValueError):
+                WorkerConfig.from_dict({**base_config, **intervals})
+
+    def test_immediate_retry_classification(self):
+        """Test transient connection errors are classified for an immediate retry."""
+        config = WorkerConfig.from_dict({
+            "worker_id": "test-worker",
+            "database_url": "sqlite:///:memory:"
+        })
+        worker = WorkerRunner(config)
+        
+        assert worker.is_immediately_retryable(ConnectionResetError())
+        assert worker.is_immediately_retryable(
+            PipelineExecutionError("step failed", cause=ConnectionResetError())
+        )
+        assert not worker.is_immediately_retryable(ValueError("bad input"))
+        assert not worker.is_immediately_retryable(PipelineExecutionError("step failed"))
+    
     def test_exponential_backoff_without_jitter(self):
         """Test exponential backoff without jitter."""
         config = WorkerConfig.from_dict({
@@ -26,6 +26,11 @@ class WorkerConfig:
     backoff_max_delay: float = 60.0
     backoff_jitter: bool = True
     
+    # Idle polling: reset to min on a lease, double on each empty poll up to max
+    initial_poll_interval: float = 0.1  # seconds
+    min_poll_interval: float = 0.05  # seconds
+    max_poll_interval: float = 1.0  # seconds
+    
     # Health monitoring
     heartbeat_interval: int = 30  # seconds
     lease_renewal_interval: int = 30  # seconds
@@ -39,6 +44,17 @@ class WorkerConfig:
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    def __post_init__(self):
+        """Reject poll intervals that would busy-loop or stall the idle poller."""
+        if self.min_poll_interval <= 0:
+            raise ValueError(f"min_poll_interval must be positive, got {self.min_poll_interval}")
+        if not self.min_poll_interval <= self.initial_poll_interval <= self.max_poll_interval:
+            raise ValueError(
+                "Poll intervals must satisfy min <= initial <= max, got "
+                f"min={self.min_poll_interval}, initial={self.initial_poll_interval}, "
+                f"max={self.max_poll_interval}"
+            )
+    
     @classmethod
     def from_environment(cls, worker_id: str) -> "WorkerConfig":
         """Create configuration from environment variables."""
@@ -49,6 +65,9 @@ class WorkerConfig:
             max_concurrent_leases=int(os.environ.get("WORKER_MAX_LEASES", "1")),
             backoff_base_delay=float(os.environ.get("WORKER_BACKOFF_BASE", "1.0")),
             backoff_max_delay=float(os.environ.get("WORKER_BACKOFF_MAX", "60.0")),
+            initial_poll_interval=float(os.environ.get("WORKER_POLL_INITIAL", "0.1")),
+            min_poll_interval=float(os.environ.get("WORKER_POLL_MIN", "0.05")),
+            max_poll_interval=float(os.environ.get("WORKER_POLL_MAX", "1.0")),
             heartbeat_interval=int(os.environ.get("WORKER_HEARTBEAT_INTERVAL", "30")),
             lease_renewal_interval=int(os.environ.get("WORKER_LEASE_RENEWAL_INTERVAL", "30")),
             cleanup_interval=int(os.environ.get("WORKER_CLEANUP_INTERVAL", "300")),
@@ -69,6 +88,9 @@ class WorkerConfig:
             backoff_base_delay=config_dict.get("backoff_base_delay", 1.0),
             backoff_max_delay=config_dict.get("backoff_max_delay", 60.0),
             backoff_jitter=config_dict.get("backoff_jitter", True),
+            initial_poll_interval=float(config_dict.get("initial_poll_interval", 0.1)),
+            min_poll_interval=float(config_dict.get("min_poll_interval", 0.05)),
+            max_poll_interval=float(config_dict.get("max_poll_interval", 1.0)),
             heartbeat_interval=config_dict.get("heartbeat_interval", 30),
             lease_renewal_interval=config_dict.get("lease_renewal_interval", 30),
             cleanup_interval=config_dict.get("cleanup_interval", 300),
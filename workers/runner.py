@@ -18,6 +18,9 @@ from observability.logging import worker_logger, set_request_context, generate_r
 # Global state for graceful shutdown
 shutdown_requested = threading.Event()
 
+# Errors that usually clear on reconnect; the first retry skips the backoff
+IMMEDIATE_RETRY_ERRORS = (ConnectionResetError,)
+
 class WorkerRunner:
     """Main worker process for executing scheduled tasks with SKIP LOCKED pattern."""
     
@@ -30,6 +33,7 @@ class WorkerRunner:
         self.current_lease = None
         self.last_heartbeat = 0
         self.last_cleanup = 0
+        self.poll_interval = config.initial_poll_interval
         
         # Database connection
         engine_kwargs = {
@@ -64,6 +68,14 @@ class WorkerRunner:
         else:
             return delay
     
+    def next_poll_interval(self, found_work: bool) -> float:
+        """Adapt the idle poll interval: reset to minimum on a lease, double on a miss."""
+        if found_work:
+            self.poll_interval = self.config.min_poll_interval
+        else:
+            self.poll_interval = min(self.poll_interval * 2, self.config.max_poll_interval)
+        return self.poll_interval
+    
     def should_retry_task(self, task: dict, attempt: int) -> bool:
         """Determine if a task should be retried based on attempt count and configuration."""
         max_retries = task.get("max_retries", 3)
@@ -211,6 +223,11 @@ class WorkerRunner:
         
         return True
     
+    def is_immediately_retryable(self, error: Exception) -> bool:
+        """Transient connection drops are retried once without a backoff delay."""
+        cause = getattr(error, "cause", None)
+        return isinstance(error, IMMEDIATE_RETRY_ERRORS) or isinstance(cause, IMMEDIATE_RETRY_ERRORS)
+    
     def process_work_item(self, lease: dict) -> bool:
         """Process a single work item with retry logic and proper error handling."""
         task = self.fetch_task(lease["task_id"])
@@ -271,16 +288,16 @@ class WorkerRunner:
                 
                 # Don't sleep after the last attempt or if shutdown requested
                 if attempt < max_retries + 1 and not shutdown_requested.is_set():
+                    if attempt == 1 and self.is_immediately_retryable(e):
+                        self.logger.info(f"Retrying task {task['id']} immediately after transient error")
+                        continue
+                    
                     delay = self.exponential_backoff_with_jitter(attempt)
                     self.logger.info(f"Retrying task {task['id']} in {delay:.2f} seconds")
                     
-                    # Sleep with shutdown check
-                    sleep_start = time.time()
-                    while time.time() - sleep_start < delay:
-                        if shutdown_requested.is_set():
-                            self.logger.info("Shutdown requested during retry delay")
-                            break
-                        time.sleep(0.1)
+                    # Wake at the deadline, or as soon as shutdown is requested
+                    if shutdown_requested.wait(timeout=delay):
+                        self.logger.info("Shutdown requested during retry delay")
 
         # All retries exhausted
         processing_time = time.time() - started.timestamp() if 'started' in locals() else 0
@@ -401,10 +418,13 @@ class WorkerRunner:
                     # Try to lease work
                     lease = self.lease_one()
                     if not lease:
-                        time.sleep(0.5)  # No work available, short sleep
+                        # No work available, back off before polling again
+                        time.sleep(self.poll_interval)
+                        self.next_poll_interval(found_work=False)
                         continue
                     
-                    # Process work item
+                    # Process work item, then poll again promptly
+                    self.next_poll_interval(found_work=True)
                     self.process_work_item(lease)
                     
                 except Exception as e: